@@ -1,6 +1,7 @@
 import os
 import multiprocessing as mp
 import logging
+from inspect import signature
 import torch
 import torch.distributed as dist
 from torch.nn.parallel import DistributedDataParallelCPU
@@ -19,13 +20,29 @@ class CalculatorTorch:
     ----------
     model: obj
         Instance of :class:`~kliff.neuralnetwork.NeuralNetwork`.
+
+    compile_model: bool (optional)
+        If ``True``, compile the model with ``torch.compile`` to reduce the Python
+        overhead of evaluating it. Compiled models do not support double backward, so
+        the uncompiled model is used when fitting to forces or stress in training mode;
+        the compiled one is used for fitting to energy and for evaluating a trained
+        model. Ignored if ``torch.compile`` is not available.
+
+    Note
+    ----
+    Forces and stress can only be differentiated w.r.t. the model parameters (as needed
+    to fit to them) when the model is in training mode, i.e. ``model.train()``. In
+    evaluation mode, i.e. ``model.eval()``, the graph for it is not created to save time
+    and memory. :meth:`~kliff.loss.LossNeuralNetworkModel.minimize` puts the model in
+    training mode before fitting.
     """
 
     implemented_property = ["energy", "forces", "stress"]
 
-    def __init__(self, model):
+    def __init__(self, model, compile_model=False):
 
         self.model = model
+        self.compiled_model = self._compile(model) if compile_model else model
         self.dtype = self.model.descriptor.dtype
         self.fingerprints_path = None
 
@@ -106,12 +123,38 @@ class CalculatorTorch:
             nprocs,
         )
 
-    def get_compute_arguments(self, batch_size=1):
-        r"""Return a list of compute arguments, each associated with a configuration."""
+    def get_compute_arguments(self, batch_size=1, num_workers=0, in_memory=True):
+        r"""Return a list of compute arguments, each associated with a configuration.
+
+        Parameters
+        ----------
+        batch_size: int (optional)
+            Number of configurations in each batch.
+
+        num_workers: int (optional)
+            Number of subprocesses used to load the fingerprints. If ``0``, the
+            fingerprints are loaded in the main process.
+
+        in_memory: bool (optional)
+            Whether to load all the fingerprints into memory. If ``False``, each sample
+            is read from the fingerprints file when it is needed.
+        """
         fname = self.fingerprints_path
-        fp = FingerprintsDataset(fname)
+        fp = FingerprintsDataset(fname, in_memory=in_memory)
+
+        # keep the workers between epochs; `persistent_workers` requires torch >= 1.7
+        kwargs = {}
+        if num_workers > 0 and "persistent_workers" in signature(DataLoader).parameters:
+            kwargs["persistent_workers"] = True
+
         loader = DataLoader(
-            dataset=fp, batch_size=batch_size, collate_fn=fingerprints_collate_fn
+            dataset=fp,
+            batch_size=batch_size,
+            collate_fn=fingerprints_collate_fn,
+            num_workers=num_workers,
+            # page-locked memory speeds up and allows asynchronous host to GPU copy
+            pin_memory=self._get_device().type == "cuda",
+            **kwargs
         )
 
         return loader
@@ -124,6 +167,8 @@ class CalculatorTorch:
 
         grad = self.use_forces or self.use_stress
 
+        self._move_to_device(batch)
+
         # collate batch input to NN
         zeta_config = [sample["zeta"] for sample in batch]
         if grad:
@@ -131,8 +176,13 @@ class CalculatorTorch:
                 zeta.requires_grad_(True)
 
         # evaluate model
+        # the model may use a different dtype from the fingerprints; cast the input to
+        # the model dtype and the output back, so that energy and forces (from dzetadr)
+        # are in the fingerprints dtype
         zeta_stacked = torch.cat(zeta_config, dim=0)
-        energy_atom = self.model(zeta_stacked)
+        model = self._get_model(grad)
+        energy_atom = model(zeta_stacked.to(self.model.dtype))
+        energy_atom = energy_atom.to(zeta_stacked.dtype)
 
         # energy
         natoms_config = [len(zeta) for zeta in zeta_config]
@@ -148,13 +198,11 @@ class CalculatorTorch:
         else:
             stress_config = []
         if grad:
+            dedz_config = self._get_denergy_dzeta(energy_atom.sum(), zeta_config)
             for i, sample in enumerate(batch):
 
-                # derivative of energy w.r.t. zeta
-                energy = energy_config[i]
-                zeta = zeta_config[i]
-                dedz = torch.autograd.grad(energy, zeta, create_graph=True)[0]
-                zeta.requires_grad_(False)  # no need of grad any more
+                dedz = dedz_config[i]
+                zeta_config[i].requires_grad_(False)  # no need of grad any more
 
                 if self.use_forces:
                     dzetadr_forces = sample["dzetadr_forces"]
@@ -172,15 +220,80 @@ class CalculatorTorch:
         self.results["stress"] = stress_config
         return {"energy": energy_config, "forces": forces_config, "stress": stress_config}
 
+    def _get_model(self, grad):
+        r"""Return the model to evaluate, compiled or not.
+
+        When training on forces or stress, a loss on dE/dzeta is backpropagated, i.e. a
+        double backward, which the compiled model does not support.
+        """
+        if grad and self.model.training:
+            return self.model
+        return self.compiled_model
+
+    def _get_denergy_dzeta(self, energy, zeta_config):
+        r"""Derivative of the total energy of a batch w.r.t. zeta of each configuration.
+
+        This is a single backward pass for the whole batch, valid since the energy of a
+        configuration only depends on its own zeta. The graph of the derivative, needed
+        to backpropagate a loss on forces and stress, is only created when training.
+        """
+        return torch.autograd.grad(energy, zeta_config, create_graph=self.model.training)
+
+    def _get_device(self):
+        r"""Return the device where the model parameters are stored."""
+        param = next(self.model.parameters(), None)
+        return torch.device("cpu") if param is None else param.device
+
+    def _move_to_device(self, batch):
+        r"""Move the tensors of the samples in a batch to the device of the model.
+
+        The samples are updated in place such that the references (e.g. energy and
+        forces) used by the loss are on the same device as the predictions.
+        """
+        device = self._get_device()
+        if device.type == "cpu":
+            return
+        for sample in batch:
+            for key, value in sample.items():
+                if isinstance(value, torch.Tensor):
+                    sample[key] = value.to(device, non_blocking=True)
+
+    @staticmethod
+    def _compile(model):
+        r"""Compile a model with ``torch.compile``, or return it as is if unavailable.
+
+        ``dynamic=True`` since the number of atoms varies between batches, which would
+        otherwise trigger a recompilation for each new shape.
+        """
+        if not hasattr(torch, "compile"):
+            logger.info('"torch.compile" not available, using the model uncompiled.')
+            return model
+        return torch.compile(model, dynamic=True)
+
+    @staticmethod
+    def _contract(denergy_dzeta, dzetadr):
+        r"""Contract dE/dzeta of shape (N, D) with dzetadr of shape (N, D, ...).
+
+        The contracted axes are the leading ones of both arrays, so (for contiguous
+        arrays) this is a single vector-matrix product on flat views, without the
+        intermediate permutation and copy of ``tensordot``. The result has the trailing
+        shape of dzetadr.
+        """
+        n = denergy_dzeta.dim()
+        out = torch.matmul(
+            denergy_dzeta.reshape(-1), dzetadr.reshape(denergy_dzeta.numel(), -1)
+        )
+        return out.reshape(dzetadr.shape[n:])
+
     @staticmethod
     def compute_forces(denergy_dzeta, dzetadr):
-        forces = -torch.tensordot(denergy_dzeta, dzetadr, dims=([0, 1], [0, 1]))
+        forces = -CalculatorTorch._contract(denergy_dzeta, dzetadr)
         return forces
 
     @staticmethod
     def compute_stress(denergy_dzeta, dzetadr, volume):
-        forces = torch.tensordot(denergy_dzeta, dzetadr, dims=([0, 1], [0, 1])) / volume
-        return forces
+        stress = CalculatorTorch._contract(denergy_dzeta, dzetadr) / volume
+        return stress
 
     def get_energy(self, batch):
         return self.results["energy"]
@@ -252,12 +365,14 @@ class CalculatorTorchSeparateSpecies(CalculatorTorch):
                 continue
 
             z_tensor = torch.stack(zeta)  # convert a list of tensor to tensor
-            energy = self.model(z_tensor)
+            # evaluate in the model dtype, and get energy in the fingerprints dtype
+            energy = self.model(z_tensor.to(self.model.dtype)).to(z_tensor.dtype)
             for e_atom, i in zip(energy, config_id_by_species[s]):
                 if energy_config[i] is None:
                     energy_config[i] = e_atom
                 else:
-                    energy_config[i] += e_atom
+                    # not in place, energy_config[i] may be a view of `energy`
+                    energy_config[i] = energy_config[i] + e_atom
 
         # forces and stress
         if not self.use_forces:
@@ -269,13 +384,12 @@ class CalculatorTorchSeparateSpecies(CalculatorTorch):
         else:
             stress_config = []
         if grad:
+            energy = torch.stack(energy_config).sum()  # total energy of the batch
+            dedz_config = self._get_denergy_dzeta(energy, zeta_config)
             for i, sample in enumerate(batch):
 
-                # derivative of energy w.r.t. zeta
-                energy = energy_config[i]
-                zeta = zeta_config[i]
-                dedz = torch.autograd.grad(energy, zeta, create_graph=True)[0]
-                zeta.requires_grad_(False)  # no need of grad any more
+                dedz = dedz_config[i]
+                zeta_config[i].requires_grad_(False)  # no need of grad any more
 
                 if self.use_forces:
                     dzetadr_forces = sample["dzetadr_forces"]
@@ -1,6 +1,9 @@
+import os
+import pickle
+import numpy as np
 import torch
 from torch.utils.data import Dataset
-from ..descriptors.descriptor import load_fingerprints
+from ..descriptors.descriptor import load_fingerprints, index_fingerprints
 
 
 class FingerprintsDataset(Dataset):
@@ -13,21 +16,59 @@ class FingerprintsDataset(Dataset):
 
     transform: callable (optional)
         Optional transform to be applied on a sample.
+
+    in_memory: bool (optional)
+        If ``True``, load all the fingerprints into memory. If ``False``, only the file
+        offset of each sample is stored, and a sample is read from the file when it is
+        requested. This is memory efficient for large datasets, and the operating
+        system caches the frequently accessed part of the file.
     """
 
-    def __init__(self, path, transform=None):
-        self.fp = load_fingerprints(path)
+    def __init__(self, path, transform=None, in_memory=True):
+        self.path = path
         self.transform = transform
+        self.in_memory = in_memory
+
+        if in_memory:
+            self.fp = load_fingerprints(path)
+        else:
+            self.fp = index_fingerprints(path)
+
+        # file handle and the process that opened it (only used if not in_memory)
+        self._file = None
+        self._pid = None
 
     def __len__(self):
         return len(self.fp)
 
     def __getitem__(self, index):
-        sample = self.fp[index]
+        if self.in_memory:
+            sample = self.fp[index]
+        else:
+            sample = self._read(self.fp[index])
         if self.transform:
             sample = self.transform(sample)
         return sample
 
+    def _read(self, offset):
+        # open the file for each process (e.g. DataLoader workers), since a handle
+        # inherited from the parent process shares its file position
+        if self._file is None or self._pid != os.getpid():
+            self._file = open(self.path, "rb")
+            self._pid = os.getpid()
+        self._file.seek(offset)
+        return pickle.load(self._file)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_pid"] = None
+        return state
+
+    def __del__(self):
+        if getattr(self, "_file", None) is not None:
+            self._file.close()
+
 
 def fingerprints_collate_fn(batch):
     r"""Convert a batch of samples into tensor.
@@ -44,12 +85,20 @@ def fingerprints_collate_fn(batch):
     -------
     tensor_batch: list
         Transform each sample into a tensor.
+
+    Note
+    ----
+    Arrays are made C-contiguous, such that e.g. ``dzetadr_forces`` of shape
+    (N, D, M) can be viewed as a (N*D, M) matrix without a copy when contracted with
+    the derivative of the energy w.r.t. zeta.
     """
     tensor_batch = []
     for i, sample in enumerate(batch):
         tensor_sample = {}
         for key, value in sample.items():
             if type(value).__module__ == "numpy":
+                if not value.flags.c_contiguous:
+                    value = np.ascontiguousarray(value)
                 value = torch.from_numpy(value)
             tensor_sample[key] = value
         tensor_batch.append(tensor_sample)
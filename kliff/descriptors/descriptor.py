@@ -259,6 +259,9 @@ class Descriptor:
         log_entry(logger, msg, level="info")
 
     def calc_zeta_dzetadr(self, configs, fit_forces, fit_stress, nprocs=mp.cpu_count()):
+        # no more processes than configurations; each extra one would only be forked
+        # (copying the descriptor) to stay idle
+        nprocs = max(1, min(nprocs, len(configs)))
         try:
             rslt = parallel.parmap1(
                 self.transform, configs, fit_forces, fit_stress, nprocs=nprocs
@@ -367,12 +370,13 @@ class Descriptor:
         return self.size
 
     def get_mean(self):
-        r"""Return a list of the mean of the fingerprints."""
-        return self.mean.copy()
+        r"""Return a list of the mean of the fingerprints, ``None`` if not computed."""
+        return None if self.mean is None else self.mean.copy()
 
     def get_stdev(self):
-        r"""Return a list of the standard deviation of the fingerprints."""
-        return self.stdev.copy()
+        r"""Return a list of the standard deviation of the fingerprints, ``None`` if not
+        computed."""
+        return None if self.stdev is None else self.stdev.copy()
 
     def get_dtype(self):
         r"""Return the data type of the fingerprints."""
@@ -431,21 +435,56 @@ def load_fingerprints(path):
     ------
     Instance of tf.data.
     """
-    data = []
-    with open(path, "rb") as f:
-        try:
-            while True:
-                x = pickle.load(f)
-                data.append(x)
-        except EOFError:
-            pass
-        except Exception as e:
-            msg = 'Cannot fingerprints from "{}". {}'.format(path, str(e))
-            raise DescriptorError(msg)
+    data = [x for _, x in _iter_fingerprints(path)]
 
     return data
 
 
+def index_fingerprints(path):
+    r"""Get the file offset of each sample in a preprocessed data file.
+
+    A sample can then be read by seeking to its offset and unpickling, without loading
+    the whole file into memory.
+
+    Parameters
+    ----------
+    path: str
+        Path to the pickled data file.
+
+    Return
+    ------
+    offsets: list
+        Offset (in bytes) of each sample in the file.
+    """
+    offsets = [offset for offset, _ in _iter_fingerprints(path)]
+
+    return offsets
+
+
+def _iter_fingerprints(path):
+    r"""Iterate over the samples in a preprocessed data file.
+
+    Yield
+    -----
+    offset: int
+        Offset (in bytes) of the sample in the file.
+
+    x: dict
+        The sample.
+    """
+    with open(path, "rb") as f:
+        while True:
+            offset = f.tell()
+            try:
+                x = pickle.load(f)
+            except EOFError:
+                return
+            except Exception as e:
+                msg = 'Cannot load fingerprints from "{}". {}'.format(path, str(e))
+                raise DescriptorError(msg)
+            yield offset, x
+
+
 def generate_full_cutoff(cutoff):
     r"""Generate a full binary cutoff dictionary.
 
@@ -290,8 +290,10 @@ class SymmetryFunction(Descriptor):
 
             if self.dtype == np.float64:
                 fmt = "{:.15e} "
+                np_fmt = "%.15e"
             else:
                 fmt = "{:.7e} "
+                np_fmt = "%.7e"
 
             # header
             fout.write("#" + "=" * 80 + "\n")
@@ -333,32 +335,24 @@ class SymmetryFunction(Descriptor):
                     rows = len(values)
                     cols = len(values[0])
                     fout.write("{}    {}    {}\n".format(name, rows, cols))
+                    # columns needed by KIM and the comment following them
                     if name == "g2":
-                        for val in values:
-                            fout.write((fmt * 2).format(val[0], val[1]))
-                            fout.write("    # eta  Rs\n")
-                        fout.write("\n")
+                        ncols, comment = 2, "# eta  Rs"
                     elif name == "g3":
-                        for val in values:
-                            fout.write((fmt).format(val[0]))
-                            fout.write("    # kappa\n")
-                        fout.write("\n")
-                    elif name == "g4":
-                        for val in values:
-                            zeta = val[0]
-                            lam = val[1]
-                            eta = val[2]
-                            fout.write((fmt * 3).format(zeta, lam, eta))
-                            fout.write("    # zeta  lambda  eta\n")
-                        fout.write("\n")
-                    elif name == "g5":
-                        for val in values:
-                            zeta = val[0]
-                            lam = val[1]
-                            eta = val[2]
-                            fout.write((fmt * 3).format(zeta, lam, eta))
-                            fout.write("    # zeta  lambda  eta\n")
-                        fout.write("\n")
+                        ncols, comment = 1, "# kappa"
+                    elif name in ["g4", "g5"]:
+                        ncols, comment = 3, "# zeta  lambda  eta"
+                    else:
+                        continue
+                    values = np.asarray(values, dtype=np.double)[:, :ncols]
+                    np.savetxt(
+                        fout,
+                        values,
+                        fmt=np_fmt,
+                        delimiter=" ",
+                        newline="     {}\n".format(comment),
+                    )
+                    fout.write("\n")
 
             #
             # data centering and normalization
@@ -380,11 +374,9 @@ class SymmetryFunction(Descriptor):
                 fout.write("{}   # descriptor size\n".format(self.get_size()))
 
                 fout.write("# mean\n")
-                for i in mean:
-                    fout.write((fmt + "\n").format(i))
+                np.savetxt(fout, mean, fmt=np_fmt, newline=" \n")
                 fout.write("\n# standard deviation\n")
-                for i in stdev:
-                    fout.write((fmt + "\n").format(i))
+                np.savetxt(fout, stdev, fmt=np_fmt, newline=" \n")
                 fout.write("\n")
 
     def get_size(self):
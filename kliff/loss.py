@@ -608,7 +608,16 @@ class LossNeuralNetworkModel(object):
 
         logger.info('"{}" instantiated.'.format(self.__class__.__name__))
 
-    def minimize(self, method, batch_size=100, num_epochs=1000, start_epoch=0, **kwargs):
+    def minimize(
+        self,
+        method,
+        batch_size=100,
+        num_epochs=1000,
+        start_epoch=0,
+        num_workers=0,
+        in_memory=True,
+        **kwargs
+    ):
         r"""Minimize the loss.
 
         Parameters
@@ -629,6 +638,14 @@ class LossNeuralNetworkModel(object):
             The starting epoch number. This is typically 0, but if continuing a training,
             it is useful to set this to the last epoch number of the previous training.
 
+        num_workers: int
+            Number of subprocesses used to load the fingerprints. If ``0``, the
+            fingerprints are loaded in the main process.
+
+        in_memory: bool
+            Whether to load all the fingerprints into memory. If ``False``, each sample
+            is read from the fingerprints file when it is needed.
+
         kwargs: dict
             Extra keyword arguments that can be used by the PyTorch optimizer.
         """
@@ -643,7 +660,9 @@ class LossNeuralNetworkModel(object):
         self.start_epoch = start_epoch
 
         # data loader
-        loader = self.calculator.get_compute_arguments(batch_size)
+        loader = self.calculator.get_compute_arguments(
+            batch_size, num_workers=num_workers, in_memory=in_memory
+        )
 
         # model save metadata
         save_prefix = self.calculator.model.save_prefix
@@ -664,6 +683,10 @@ class LossNeuralNetworkModel(object):
         msg = "Start minimization using optimization method: {}.".format(self.method)
         log_entry(logger, msg, level="info")
 
+        # the model may be in evaluation mode, e.g. loaded with `mode="eval"`, in which
+        # the calculator does not create the graph needed to fit to forces and stress
+        self.calculator.model.train()
+
         # optimizing
         try:
             self.optimizer = getattr(torch.optim, method)(
@@ -137,9 +137,11 @@ class KIMComputeArguments(ComputeArguments):
         """
 
         # inquire information from conf
-        cell = np.asarray(self.conf.get_cell(), dtype=np.double)
+        cell = np.ascontiguousarray(self.conf.get_cell(), dtype=np.double)
         PBC = np.asarray(self.conf.get_PBC(), dtype=np.intc)
-        contributing_coords = np.asarray(self.conf.get_coordinates(), dtype=np.double)
+        contributing_coords = np.ascontiguousarray(
+            self.conf.get_coordinates(), dtype=np.double
+        )
         contributing_species = self.conf.get_species()
         num_contributing = self.conf.get_number_of_atoms()
         self.num_contributing_particles = num_contributing
@@ -14,13 +14,18 @@ class LJComputeArguments(ComputeArguments):
 
     def __init__(self, *args, **kwargs):
         super(LJComputeArguments, self).__init__(*args, **kwargs)
+        self.neigh = None
+        self.neigh_geometry = None
         self.refresh(self.influence_distance)
 
     def refresh(self, influence_distance=None, params=None):
         """
         Refresh settings.
 
-        Recreating the neighbor list due to the change of influence distance.
+        Recreating the neighbor list due to the change of influence distance. The
+        current neighbor list is kept if neither the influence distance nor the
+        configuration (coords, cell, PBC, and species, also if modified in place) has
+        changed.
         """
         if influence_distance is not None:
             infl_dist = influence_distance
@@ -29,7 +34,23 @@ class LJComputeArguments(ComputeArguments):
                 infl_dist = params["influence_distance"].get_value()[0]
             except KeyError:
                 raise ParameterError('"influence_distance" not provided by calculator."')
+
+        # a snapshot of the configuration, cheap compared to building the neighbor list
+        conf = self.conf
+        geometry = (
+            np.asarray(conf.coords).tobytes(),
+            np.asarray(conf.cell).tobytes(),
+            np.asarray(conf.PBC).tobytes(),
+            tuple(conf.species),
+        )
+        if (
+            self.neigh is not None
+            and infl_dist == self.influence_distance
+            and geometry == self.neigh_geometry
+        ):
+            return
         self.influence_distance = infl_dist
+        self.neigh_geometry = geometry
 
         # create neighbor list
         self.neigh = NeighborList(self.conf, infl_dist, padding_need_neigh=False)
@@ -11,22 +11,40 @@ class ModelTorch(nn.Module):
     r"""Base class for machine learning models.
 
     Typically, a user will not directly use this.
+
+    Parameters
+    ----------
+    descriptor: object
+        A descriptor that transforms atomic environment information to the fingerprints.
+
+    seed: int (optional)
+        Global seed for random numbers.
+
+    dtype: torch.dtype (optional)
+        Data type of the model parameters, e.g. ``torch.float32``. It can differ from
+        that of the fingerprints, which are cast to it before evaluating the model. If
+        ``None``, the data type of the fingerprints is used.
     """
 
-    def __init__(self, descriptor, seed=35):
+    def __init__(self, descriptor, seed=35, dtype=None):
         super(ModelTorch, self).__init__()
 
         self.seed = seed
         torch.manual_seed(seed)
 
         self.descriptor = descriptor
-        dtype = self.descriptor.get_dtype()
-        if dtype == np.float32:
-            self.dtype = torch.float32
-        elif dtype == np.float64:
-            self.dtype = torch.float64
+        if dtype is not None:
+            if not (isinstance(dtype, torch.dtype) and dtype.is_floating_point):
+                raise ModelTorchError('Not support dtype "{}".'.format(dtype))
+            self.dtype = dtype
         else:
-            raise ModelTorchError('Not support dtype "{}".'.format(dtype))
+            dtype = self.descriptor.get_dtype()
+            if dtype == np.float32:
+                self.dtype = torch.float32
+            elif dtype == np.float64:
+                self.dtype = torch.float64
+            else:
+                raise ModelTorchError('Not support dtype "{}".'.format(dtype))
 
         self.save_prefix = None
         self.save_start = None
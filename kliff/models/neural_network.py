@@ -1,7 +1,9 @@
 import os
+import copy
 import logging
 import numpy as np
 import torch
+import torch.nn as nn
 from .model_torch import ModelTorch
 from ..log import log_entry
 
@@ -21,12 +23,18 @@ class NeuralNetwork(ModelTorch):
 
     seed: int (optional)
         Global seed for random numbers.
+
+    dtype: torch.dtype (optional)
+        Data type of the network parameters. Fingerprints are cast to it before being
+        fed to the network, so e.g. ``torch.float32`` can be used with ``np.float64``
+        fingerprints. If ``None``, the data type of the fingerprints is used.
     """
 
-    def __init__(self, descriptor, seed=35):
-        super(NeuralNetwork, self).__init__(descriptor, seed)
+    def __init__(self, descriptor, seed=35, dtype=None):
+        super(NeuralNetwork, self).__init__(descriptor, seed, dtype)
 
         self.layers = None
+        self._layer_names = None
 
         logger.info('"{}" instantiated.'.format(self.__class__.__name__))
 
@@ -45,13 +53,14 @@ class NeuralNetwork(ModelTorch):
             report_error(
                 '"add_layers" called multiple times. It should be called only once.'
             )
-        else:
-            self.layers = []
 
-        for la in layers:
-            self.layers.append(la)
+        # layers and their class names (used by write_kim_model); tuples since the
+        # layers cannot be changed once added
+        self.layers = tuple(layers)
+        self._layer_names = tuple(la.__class__.__name__ for la in self.layers)
+        for i, la in enumerate(self.layers):
             # set it as attr so that parameters are automatically registered
-            setattr(self, "layer_{}".format(len(self.layers)), la)
+            setattr(self, "layer_{}".format(i + 1), la)
 
         # check shape of first layer and last layer
         first = self.layers[0]
@@ -67,10 +76,53 @@ class NeuralNetwork(ModelTorch):
         self.type(self.dtype)
 
     def forward(self, x):
-        for j, layer in enumerate(self.layers):
+        for layer in self.layers:
             x = layer(x)
         return x
 
+    def quantize_for_inference(self):
+        r"""Return a copy of the model with its ``Linear`` layers quantized to int8.
+
+        Weights are stored as int8 and the inputs to each ``Linear`` layer are quantized
+        on the fly, which reduces the cost of evaluating the network on CPU. The returned
+        model is in evaluation mode, with ``dtype`` ``torch.float32``, and shares the
+        descriptor of this model. It can be used with
+        :class:`~kliff.calculators.CalculatorTorch` to predict energies. Quantized
+        layers do not support autograd, so it cannot predict forces or stress, and it
+        cannot be trained, saved, or written as a KIM model; use this model for those.
+
+        This model itself is not modified.
+
+        Return
+        ------
+        NeuralNetwork
+            The quantized model.
+        """
+        if self.layers is None:
+            report_error('"add_layers" should be called before "quantize_for_inference".')
+
+        try:
+            from torch.ao.quantization import quantize_dynamic
+        except ImportError:
+            try:
+                from torch.quantization import quantize_dynamic
+            except ImportError:
+                report_error("Quantization not supported by the installed PyTorch.")
+
+        # the descriptor (with its mean and stdev) is shared, not copied
+        model = copy.deepcopy(self, memo={id(self.descriptor): self.descriptor})
+        model.float().eval()
+        model.dtype = torch.float32
+        quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8, inplace=True)
+
+        # the `layer_<k>` attributes are replaced by the quantized layers
+        model.layers = tuple(
+            getattr(model, "layer_{}".format(i + 1)) for i in range(len(model.layers))
+        )
+        model._layer_names = tuple(la.__class__.__name__ for la in model.layers)
+
+        return model
+
     def write_kim_model(self, path=None, driver_name=None, dropout_ensemble_size=None):
         """Write out a model that is compatible with the KIM API.
 
@@ -122,7 +174,13 @@ class NeuralNetwork(ModelTorch):
 
         # PyTorch uses x*W^T + b, so we need to transpose it.
         # see https://pytorch.org/docs/stable/nn.html#linear
-        weights = [torch.t(w) for w in weights]
+        weights = [torch.t(w).detach().cpu().double().numpy() for w in weights]
+        biases = [b.detach().cpu().double().numpy() for b in biases]
+
+        if self.dtype == torch.float64:
+            fmt = "%23.15e"
+        else:
+            fmt = "%15.7e"
 
         with open(os.path.join(path, fname), "w") as fout:
             # header
@@ -175,13 +233,7 @@ class NeuralNetwork(ModelTorch):
                     fout.write(
                         "# weight of output layer, shape({}, {})\n".format(rows, cols)
                     )
-                for line in w:
-                    for item in line:
-                        if self.dtype == torch.float64:
-                            fout.write("{:23.15e}".format(item))
-                        else:
-                            fout.write("{:15.7e}".format(item))
-                    fout.write("\n")
+                np.savetxt(fout, w, fmt=fmt, delimiter="")
 
                 # bias
                 if i != num_layers - 1:
@@ -190,12 +242,8 @@ class NeuralNetwork(ModelTorch):
                     )
                 else:
                     fout.write("# bias of output layer, shape({}, )\n".format(cols))
-                for item in b:
-                    if self.dtype == torch.float64:
-                        fout.write("{:23.15e}".format(item))
-                    else:
-                        fout.write("{:15.7e}".format(item))
-                fout.write("\n\n")
+                np.savetxt(fout, b.reshape(1, -1), fmt=fmt, delimiter="")
+                fout.write("\n")
 
     def write_kim_dropout_binary(self, path, fname="dropout_binary.params", size=None):
 
@@ -230,12 +278,8 @@ class NeuralNetwork(ModelTorch):
                     n = num_units[i]
                     k = keep_prob[i]
                     rnd = np.floor(np.random.uniform(k, k + 1, n))
-                    rnd = np.asarray(rnd, dtype=np.intc)
-                    for d in rnd:
-                        d = 1 if d > 1 else d
-                        d = 0 if d < 0 else d
-                        fout.write("{} ".format(d))
-                    fout.write("\n")
+                    rnd = np.clip(np.asarray(rnd, dtype=np.intc), 0, 1)
+                    np.savetxt(fout, rnd.reshape(1, -1), fmt="%d", newline=" \n")
 
     @staticmethod
     def write_kim_cmakelists(path, modelname, driver_name, paramfiles, version):
@@ -265,9 +309,9 @@ class NeuralNetwork(ModelTorch):
 
     def _group_layers(
         self,
-        param_layer=["Linear"],
-        activ_layer=["Sigmoid", "Tanh", "ReLU", "ELU"],
-        dropout_layer=["Dropout"],
+        param_layer=("Linear",),
+        activ_layer=("Sigmoid", "Tanh", "ReLU", "ELU"),
+        dropout_layer=("Dropout",),
     ):
         r"""Divide all the layers into groups.
 
@@ -284,9 +328,14 @@ class NeuralNetwork(ModelTorch):
         groups = []
         new_group = []
 
-        supported = param_layer + activ_layer + dropout_layer
-        for i, layer in enumerate(self.layers):
-            name = layer.__class__.__name__
+        param_layer = frozenset(param_layer)
+        activ_layer = frozenset(activ_layer)
+        dropout_layer = frozenset(dropout_layer)
+        supported = param_layer | activ_layer | dropout_layer
+
+        names = self._layer_names
+        insts = self.layers
+        for i, name in enumerate(names):
             if name not in supported:
                 report_error(
                     'Layer "{}" not supported by KIM model. Cannot proceed '
@@ -296,13 +345,13 @@ class NeuralNetwork(ModelTorch):
             if name in activ_layer:
                 if i == 0:
                     report_error('First layer cannot be a "{}" layer'.format(name))
-                if self.layers[i - 1].__class__.__name__ not in param_layer:
+                if names[i - 1] not in param_layer:
                     report_error(
                         'Cannot convert to KIM model. a "{}" layer must follow '
                         'a "Linear" layer.'.format(name)
                     )
             if name[:7] in dropout_layer:
-                if self.layers[i - 1].__class__.__name__ not in activ_layer:
+                if names[i - 1] not in activ_layer:
                     report_error(
                         'Cannot convert to KIM model. a "{}" layer must follow '
                         "an activation layer.".format(name)
@@ -310,7 +359,7 @@ class NeuralNetwork(ModelTorch):
             if name in param_layer:
                 groups.append(new_group)
                 new_group = []
-            new_group.append(layer)
+            new_group.append(insts[i])
         groups.append(new_group)
 
         return groups, param_layer, activ_layer, dropout_layer
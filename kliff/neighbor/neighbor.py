@@ -73,18 +73,30 @@ class NeighborList:
         self.create_neigh()
 
     def create_neigh(self):
-        coords_cb = np.asarray(self.conf.get_coordinates(), dtype=np.double)
+        # natoms is taken from the first axis below, so make sure coords is (N, 3)
+        # even if the configuration stores it flattened; the C++ side reads the raw
+        # buffers, so they must be C-contiguous
+        coords_cb = np.ascontiguousarray(self.conf.get_coordinates(), dtype=np.double)
+        coords_cb = coords_cb.reshape(-1, 3)
         species_cb = self.conf.get_species()
-        cell = np.asarray(self.conf.get_cell(), dtype=np.double)
+        cell = np.ascontiguousarray(self.conf.get_cell(), dtype=np.double)
         PBC = np.asarray(self.conf.get_PBC(), dtype=np.intc)
 
         # create padding atoms
         species_code_cb = np.asarray(
             [atomic_number[s] for s in species_cb], dtype=np.intc
         )
-        out = nl.create_paddings(self.infl_dist, cell, PBC, coords_cb, species_code_cb)
-        coords_pd, species_code_pd, image_pd, error = out
-        check_error(error, "nl.create_padding")
+        if np.any(PBC):
+            out = nl.create_paddings(
+                self.infl_dist, cell, PBC, coords_cb, species_code_cb
+            )
+            coords_pd, species_code_pd, image_pd, error = out
+            check_error(error, "nl.create_padding")
+        else:
+            # no periodic direction, no padding atoms
+            coords_pd = np.empty((0, 3), dtype=np.double)
+            species_code_pd = np.empty(0, dtype=np.intc)
+            image_pd = np.empty(0, dtype=np.intc)
         species_pd = [atomic_species[i] for i in species_code_pd]
 
         self.padding_coords = np.asarray(coords_pd, dtype=np.double)
@@ -94,11 +106,15 @@ class NeighborList:
         num_cb = coords_cb.shape[0]
         num_pd = coords_pd.shape[0]
 
-        self.coords = np.asarray(np.concatenate((coords_cb, coords_pd)), dtype=np.double)
+        # fill contrib + padding arrays in place; concatenating `arange` (int64) with
+        # `image_pd` (intc) would upcast and then need another copy back to intc
+        self.coords = np.empty((num_cb + num_pd, 3), dtype=np.double)
+        self.coords[:num_cb] = coords_cb
+        self.coords[num_cb:] = coords_pd
         self.species = np.concatenate((species_cb, species_pd))
-        self.image = np.asarray(
-            np.concatenate((np.arange(num_cb), image_pd)), dtype=np.intc
-        )
+        self.image = np.empty(num_cb + num_pd, dtype=np.intc)
+        self.image[:num_cb] = np.arange(num_cb)
+        self.image[num_cb:] = image_pd
         # flag to indicate whether to create neighborlist for an atom
         need_neigh = np.ones(num_cb + num_pd, dtype=np.intc)
         if not self.padding_need_neigh:
@@ -174,17 +190,10 @@ class NeighborList:
         cutoffs = np.asarray([self.infl_dist], dtype=np.double)
         neigh_list_index = 0
 
-        numneigh = []
-        neighlist = []
-        for i in range(N):
-            num_neigh, neigh_indices, error = nl.get_neigh(
-                self.neigh, cutoffs, neigh_list_index, i
-            )
-            check_error(error, "nl.get_neigh")
-            numneigh.append(num_neigh)
-            neighlist.append(neigh_indices)
-        neighlist = np.asarray(np.concatenate(neighlist), dtype=np.intc)
-        numneigh = np.asarray(numneigh, dtype=np.intc)
+        numneigh, neighlist, error = nl.get_numneigh_and_neighlist_1D(
+            self.neigh, cutoffs, neigh_list_index, N
+        )
+        check_error(error, "nl.get_numneigh_and_neighlist_1D")
 
         return numneigh, neighlist
 
@@ -218,9 +227,9 @@ class NeighborList:
         r"""Return coords of padding atoms."""
         return self.padding_coords.copy()
 
-    def get_padding_speices(self):
+    def get_padding_species(self):
         r"""Return species string of padding atoms."""
-        return self.padding_speices[:]
+        return self.padding_species[:]
 
     def get_padding_species_code(self, mapping):
         r"""Integer species code of padding atoms.
@@ -267,21 +276,10 @@ def assemble_forces(forces, n, padding_image):
     # numpy slicing does not make a copy !!!
     total_forces = np.array(forces[:n])
 
-    has_padding = True if padding_image.size != 0 else False
-
-    if has_padding:
-
-        pad_forces = forces[n:]
-        n_padding = pad_forces.shape[0]
-
-        if n < n_padding:
-            for i in range(n):
-                # indices of padding atoms that are images of contributing atom i
-                indices = np.where(padding_image == i)
-                total_forces[i] += np.sum(pad_forces[indices], axis=0)
-        else:
-            for f, org_index in zip(pad_forces, padding_image):
-                total_forces[org_index] += f
+    # scatter-add the padding forces onto their contributing atoms in one call;
+    # unlike `total_forces[padding_image] += ...`, repeated indices are accumulated
+    if padding_image.size != 0:
+        np.add.at(total_forces, padding_image, forces[n:])
 
     return total_forces
 
@@ -117,14 +117,18 @@ int nbl_build(NeighList * const nl,
     return 1;
   }
 
-  // assign atoms into cells
-  std::vector<std::vector<int> > cells(size_total);
-  for (int i = 0; i < numberOfParticles; i++)
+  // assign atoms into cells, stored as a flat linked list: head[c] is the first
+  // atom in cell c and next[i] the atom after i in the same cell (-1 ends it).
+  // Atoms are inserted in reverse so that each cell is walked in ascending order.
+  std::vector<int> head(size_total, -1);
+  std::vector<int> next(numberOfParticles);
+  for (int i = numberOfParticles - 1; i >= 0; i--)
   {
     int index[DIM];
     coords_to_index(&coordinates[DIM * i], size, max, min, index);
     int idx = index[0] + index[1] * size[0] + index[2] * size[0] * size[1];
-    cells[idx].push_back(i);
+    next[i] = head[idx];
+    head[idx] = i;
   }
 
   // create neighbors
@@ -152,6 +156,10 @@ int nbl_build(NeighList * const nl,
       int index[DIM];
       coords_to_index(&coordinates[DIM * i], size, max, min, index);
 
+      double const xi = coordinates[DIM * i + 0];
+      double const yi = coordinates[DIM * i + 1];
+      double const zi = coordinates[DIM * i + 2];
+
       // loop over neighboring cells and the cell atom i resides
       for (int ii = std::max(0, index[0] - 1);
            ii <= std::min(index[0] + 1, size[0] - 1);
@@ -167,19 +175,15 @@ int nbl_build(NeighList * const nl,
           {
             int idx = ii + jj * size[0] + kk * size[0] * size[1];
 
-            for (size_t m = 0; m < cells[idx].size(); m++)
+            for (int n = head[idx]; n != -1; n = next[n])
             {
-              int n = cells[idx][m];
               if (n != i)
               {
-                double rsq = 0.0;
-
-                for (int k = 0; k < DIM; k++)
-                {
-                  double del
-                      = coordinates[DIM * n + k] - coordinates[DIM * i + k];
-                  rsq += del * del;
-                }
+                double const * cn = coordinates + DIM * n;
+                double const dx = cn[0] - xi;
+                double const dy = cn[1] - yi;
+                double const dz = cn[2] - zi;
+                double const rsq = dx * dx + dy * dy + dz * dz;
                 if (rsq < TOL)
                 {
                   std::ostringstream stringStream;
@@ -277,6 +281,13 @@ int nbl_create_paddings(int const numberOfParticles,
                         std::vector<int> & speciesCodeOfPaddings,
                         std::vector<int> & masterOfPaddings)
 {
+  // no periodic direction, no padding atoms
+  if (PBC[0] == 0 && PBC[1] == 0 && PBC[2] == 0)
+  {
+    numberOfPaddings = 0;
+    return 0;
+  }
+
   // transform coordinates into fractional coordinates
   double tcell[9];
   double fcell[9];
@@ -312,19 +323,18 @@ int nbl_create_paddings(int const numberOfParticles,
     max[i] += 1e-10;
   }
 
+  // face normals b x c, c x a, a x b (the first also gives the volume)
+  double xprod[DIM][DIM];
+  cross(cell + 3, cell + 6, xprod[0]);
+  cross(cell + 6, cell + 0, xprod[1]);
+  cross(cell + 0, cell + 3, xprod[2]);
+
   // volume of cell
-  double xprod[DIM];
-  cross(cell + 3, cell + 6, xprod);
-  double volume = std::abs(dot(cell, xprod));
+  double volume = std::abs(dot(cell, xprod[0]));
 
   // distance between parallelepiped cell faces
   double dist[DIM];
-  cross(cell + 3, cell + 6, xprod);
-  dist[0] = volume / norm(xprod);
-  cross(cell + 6, cell + 0, xprod);
-  dist[1] = volume / norm(xprod);
-  cross(cell, cell + 3, xprod);
-  dist[2] = volume / norm(xprod);
+  for (int i = 0; i < DIM; i++) { dist[i] = volume / norm(xprod[i]); }
 
   // number of cells in each direction
   double ratio[DIM];
@@ -335,7 +345,25 @@ int nbl_create_paddings(int const numberOfParticles,
     size[i] = static_cast<int>(std::ceil(ratio[i]));
   }
 
-  // creating padding atoms
+  // select the necessary atoms to repeat for the most outside bins
+  // the following few lines can be easily understood when assuming size=1
+  // The test only depends on the atom, not on the image, so it is done once
+  // here and stored as one bit per face (xlo, xhi, ylo, yhi, zlo, zhi).
+  std::vector<int> skip_faces(numberOfParticles, 0);
+  for (int at = 0; at < numberOfParticles; at++)
+  {
+    for (int d = 0; d < DIM; d++)
+    {
+      double const u = frac_coords[DIM * at + d];
+      double const margin = static_cast<double>(size[d]) - ratio[d];
+      if (u - min[d] < margin) { skip_faces[at] |= 1 << (2 * d); }
+      if (max[d] - u < margin) { skip_faces[at] |= 1 << (2 * d + 1); }
+    }
+  }
+
+  // image cells to repeat the atoms into, with the faces of the outermost
+  // bins each of them lies on: (i, j, k, faces) per image
+  std::vector<int> images;
   for (int i = -size[0]; i <= size[0]; i++)
   {
     for (int j = -size[1]; j <= size[1]; j++)
@@ -350,49 +378,67 @@ int nbl_create_paddings(int const numberOfParticles,
         if (PBC[1] == 0 && j != 0) { continue; }
         if (PBC[2] == 0 && k != 0) { continue; }
 
-        for (int at = 0; at < numberOfParticles; at++)
+        int const shell[DIM] = {i, j, k};
+        int faces = 0;
+        for (int d = 0; d < DIM; d++)
         {
-          double x = frac_coords[DIM * at + 0];
-          double y = frac_coords[DIM * at + 1];
-          double z = frac_coords[DIM * at + 2];
-
-          // select the necessary atoms to repeat for the most outside bins
-          // the following few lines can be easily understood when assuming
-          // size=1
-          if (i == -size[0]
-              && x - min[0] < static_cast<double>(size[0]) - ratio[0])
-          { continue; }
-          if (i == size[0]
-              && max[0] - x < static_cast<double>(size[0]) - ratio[0])
-          { continue; }
-          if (j == -size[1]
-              && y - min[1] < static_cast<double>(size[1]) - ratio[1])
-          { continue; }
-          if (j == size[1]
-              && max[1] - y < static_cast<double>(size[1]) - ratio[1])
-          { continue; }
-          if (k == -size[2]
-              && z - min[2] < static_cast<double>(size[2]) - ratio[2])
-          { continue; }
-          if (k == size[2]
-              && max[2] - z < static_cast<double>(size[2]) - ratio[2])
-          { continue; }
-
-          // fractional coordinates of padding atom at
-          double atom_coords[3] = {i + x, j + y, k + z};
-
-          // absolute coordinates of padding atoms
-          coordinatesOfPaddings.push_back(dot(tcell, atom_coords));
-          coordinatesOfPaddings.push_back(dot(tcell + 3, atom_coords));
-          coordinatesOfPaddings.push_back(dot(tcell + 6, atom_coords));
-
-          // padding speciesCode code and image
-          speciesCodeOfPaddings.push_back(speciesCode[at]);
-          masterOfPaddings.push_back(at);
+          if (shell[d] == -size[d]) { faces |= 1 << (2 * d); }
+          if (shell[d] == size[d]) { faces |= 1 << (2 * d + 1); }
         }
+        images.push_back(i);
+        images.push_back(j);
+        images.push_back(k);
+        images.push_back(faces);
       }
     }
   }
+  int const numberOfImages = images.size() / 4;
+
+  // count the padding atoms exactly, from the number of atoms sharing each
+  // face bitmask, so that the output is allocated only once
+  int count_faces[64] = {0};
+  for (int at = 0; at < numberOfParticles; at++) { count_faces[skip_faces[at]]++; }
+  int total = 0;
+  for (int m = 0; m < numberOfImages; m++)
+  {
+    int const faces = images[4 * m + 3];
+    for (int f = 0; f < 64; f++)
+    {
+      if (!(f & faces)) { total += count_faces[f]; }
+    }
+  }
+  coordinatesOfPaddings.reserve(coordinatesOfPaddings.size() + DIM * total);
+  speciesCodeOfPaddings.reserve(speciesCodeOfPaddings.size() + total);
+  masterOfPaddings.reserve(masterOfPaddings.size() + total);
+
+  // creating padding atoms
+  for (int m = 0; m < numberOfImages; m++)
+  {
+    int const i = images[4 * m + 0];
+    int const j = images[4 * m + 1];
+    int const k = images[4 * m + 2];
+    int const faces = images[4 * m + 3];
+
+    // cartesian shift of this image, i.e. i*a + j*b + k*c of the cell vectors
+    double shift[DIM];
+    for (int d = 0; d < DIM; d++)
+    { shift[d] = i * cell[d] + j * cell[3 + d] + k * cell[6 + d]; }
+
+    for (int at = 0; at < numberOfParticles; at++)
+    {
+      if (skip_faces[at] & faces) { continue; }
+
+      // absolute coordinates of padding atoms
+      const double * atom_coords = coordinates + (DIM * at);
+      coordinatesOfPaddings.push_back(atom_coords[0] + shift[0]);
+      coordinatesOfPaddings.push_back(atom_coords[1] + shift[1]);
+      coordinatesOfPaddings.push_back(atom_coords[2] + shift[2]);
+
+      // padding speciesCode code and image
+      speciesCodeOfPaddings.push_back(speciesCode[at]);
+      masterOfPaddings.push_back(at);
+    }
+  }
 
   numberOfPaddings = masterOfPaddings.size();
 
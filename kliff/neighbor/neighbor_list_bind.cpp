@@ -42,10 +42,10 @@ PYBIND11_MODULE(nl, module)
   module.def(
       "build",
       [](NeighList * const nl,
-         py::array_t<double> coords,
+         py::array_t<double, py::array::c_style> coords,
          double const influenceDistance,
-         py::array_t<double> cutoffs,
-         py::array_t<int> need_neigh) {
+         py::array_t<double, py::array::c_style> cutoffs,
+         py::array_t<int, py::array::c_style> need_neigh) {
         int Natoms_1 = coords.size() / 3;
         int Natoms_2 = need_neigh.size();
         int error = Natoms_1 == Natoms_2 ? 0 : 1;
@@ -78,7 +78,7 @@ PYBIND11_MODULE(nl, module)
   module.def(
       "get_neigh",
       [](NeighList const * const nl,
-         py::array_t<double> cutoffs,
+         py::array_t<double, py::array::c_style> cutoffs,
          int const neighborListIndex,
          int const particleNumber) {
         int numberOfNeighbors = 0;
@@ -119,6 +119,68 @@ PYBIND11_MODULE(nl, module)
       py::arg("particle_number"),
       "Return(number_of_neighbors, neighbors_of_particle, error)");
 
+  module.def(
+      "get_numneigh_and_neighlist_1D",
+      [](NeighList const * const nl,
+         py::array_t<double, py::array::c_style> cutoffs,
+         int const neighborListIndex,
+         int const numberOfParticles) {
+        int error = 0;
+        double const * pcutoffs = cutoffs.data();
+        int numberOfCutoffs = cutoffs.size();
+
+        // the neighbors of particles 0, 1, ... are stored back to back, so
+        // those of the first `numberOfParticles` are one contiguous block
+        int numberOfNeighbors = 0;
+        int const * neighOfAtom = NULL;
+        int const * neighborList = NULL;
+        std::vector<int> numneigh(numberOfParticles);
+        int total = 0;
+        for (int i = 0; i < numberOfParticles; i++)
+        {
+          error = nbl_get_neigh(nl,
+                                numberOfCutoffs,
+                                pcutoffs,
+                                neighborListIndex,
+                                i,
+                                &numberOfNeighbors,
+                                &neighOfAtom);
+          if (error) { break; }
+          if (i == 0) { neighborList = neighOfAtom; }
+          numneigh[i] = numberOfNeighbors;
+          total += numberOfNeighbors;
+        }
+        if (error) { total = 0; }
+
+        // pack as numpy arrays (data are copied)
+        auto numneigh_array = py::array(py::buffer_info(
+            numneigh.data(),
+            sizeof(int),
+            py::format_descriptor<int>::format(),
+            1,
+            {error ? 0 : numberOfParticles},
+            {sizeof(int)}));
+
+        auto neighlist_array = py::array(py::buffer_info(
+            const_cast<int *>(neighborList),
+            sizeof(int),
+            py::format_descriptor<int>::format(),
+            1,
+            {total},
+            {sizeof(int)}));
+
+        py::tuple re(3);
+        re[0] = numneigh_array;
+        re[1] = neighlist_array;
+        re[2] = error;
+        return re;
+      },
+      py::arg("NeighList"),
+      py::arg("cutoffs").noconvert(),
+      py::arg("neighborListIndex"),
+      py::arg("number_of_particles"),
+      "Return(number_of_neighbors, neighbor_list, error)");
+
   // cannot bind `nbl_get_neigh_kim` directly, since it has pointer arguments
   // so we return a pointer to this function
   module.def("get_neigh_kim", []() {
@@ -133,10 +195,10 @@ PYBIND11_MODULE(nl, module)
   module.def(
       "create_paddings",
       [](double const influenceDistance,
-         py::array_t<double> cell,
-         py::array_t<int> PBC,
-         py::array_t<double> coords,
-         py::array_t<int> species) {
+         py::array_t<double, py::array::c_style> cell,
+         py::array_t<int, py::array::c_style> PBC,
+         py::array_t<double, py::array::c_style> coords,
+         py::array_t<int, py::array::c_style> species) {
         int Natoms_1 = coords.size() / 3;
         int Natoms_2 = species.size();
         int error = Natoms_1 == Natoms_2 ? 0 : 1;
@@ -24,23 +24,27 @@ class Dropout(torch.nn.modules.dropout._DropoutNd):
         iteration.
     """
 
-    def forward(self, input):
+    def forward(self, input: torch.Tensor) -> torch.Tensor:
         dim = input.dim()
-        shape = input.shape
-        if dim == 2:
-            shape_4D = (1, *shape, 1)
-        elif dim == 3:
-            if shape[0] != 1:
-                raise Exception("Shape[0] needs to be 1 for a 3D tensor.")
-            shape_4D = (*shape, 1)
-
-        else:
-            raise Exception(
+        if dim == 3:
+            if input.shape[0] != 1:
+                raise ValueError("Shape[0] needs to be 1 for a 3D tensor.")
+        elif dim != 2:
+            raise ValueError(
                 "Input need to be 2D or 3D tensor, but got a " "{}D tensor.".format(dim)
             )
-        x = torch.reshape(input, shape_4D)
-        x = torch.transpose(x, 1, 2)
-        y = torch.nn.functional.dropout2d(x, self.p, self.training, self.inplace)
-        y = torch.transpose(y, 1, 2)
-        y = torch.reshape(y, shape)
-        return y
+
+        if not self.training or self.p == 0.0:
+            return input
+
+        # a single mask over the descriptor dimension, broadcast to all atoms
+        mask_shape = [1] * (dim - 1) + [input.shape[-1]]
+        if self.p == 1.0:
+            mask = input.new_zeros(mask_shape)
+        else:
+            mask = input.new_empty(mask_shape).bernoulli_(1 - self.p).div_(1 - self.p)
+
+        if self.inplace:
+            return input.mul_(mask)
+        else:
+            return input * mask
@@ -0,0 +1,55 @@
+import os
+import numpy as np
+from torch.utils.data import DataLoader
+from kliff.dataset import Dataset
+from kliff.dataset.dataset_torch import FingerprintsDataset, fingerprints_collate_fn
+from kliff.descriptors import SymmetryFunction
+
+
+def generate_fingerprints(fname):
+    dset = Dataset()
+    dset.read("./configs_extxyz/Si_4")
+    desc = SymmetryFunction(
+        cut_name="cos", cut_dists={"Si-Si": 5.0}, hyperparams="set30", normalize=False
+    )
+    desc.generate_fingerprints(
+        dset.get_configs(), fit_forces=True, fingerprints_path=fname
+    )
+
+
+def assert_same_sample(a, b):
+    assert a.keys() == b.keys()
+    for key in a:
+        if key != "configuration":
+            assert np.array_equal(a[key], b[key])
+
+
+def test_fingerprints_dataset(tmp_path):
+    fname = os.path.join(str(tmp_path), "fingerprints.pkl")
+    generate_fingerprints(fname)
+
+    in_memory = FingerprintsDataset(fname, in_memory=True)
+    on_disk = FingerprintsDataset(fname, in_memory=False)
+    assert len(in_memory) == len(on_disk) == 4
+
+    # random access
+    for i in [2, 0, 3, 1, 2]:
+        assert_same_sample(in_memory[i], on_disk[i])
+
+    # through a data loader, with samples read in worker processes
+    for num_workers in [0, 2]:
+        loader = DataLoader(
+            on_disk,
+            batch_size=2,
+            collate_fn=fingerprints_collate_fn,
+            num_workers=num_workers,
+        )
+        samples = [s for batch in loader for s in batch]
+        ref = [fingerprints_collate_fn([in_memory[i]])[0] for i in range(len(in_memory))]
+        assert len(samples) == len(ref)
+        for a, b in zip(samples, ref):
+            assert_same_sample(a, b)
+
+
+if __name__ == "__main__":
+    test_fingerprints_dataset(".")
@@ -1,9 +1,11 @@
 import os
+import pickle
 import numpy as np
 import itertools
 from kliff.dataset import Configuration
 from kliff.descriptors.descriptor import Descriptor
 from kliff.descriptors.descriptor import load_fingerprints
+from kliff.descriptors.descriptor import index_fingerprints
 from kliff.descriptors.descriptor import DescriptorError
 
 
@@ -156,5 +158,28 @@ def test_descriptor():
                 assert np.allclose(data["zeta"], _zeta)
 
 
+def test_index_fingerprints(tmp_path):
+    fname = "./configs_extxyz/Si.xyz"
+    conf = Configuration(format="extxyz", identifier=fname)
+    conf.read(fname)
+    configs = [conf, conf, conf]
+
+    fp_path = os.path.join(str(tmp_path), "fingerprints.pkl")
+    desc = ExampleDescriptor(normalize=False)
+    desc.generate_fingerprints(configs, fit_forces=True, fingerprints_path=fp_path)
+
+    data = load_fingerprints(fp_path)
+    offsets = index_fingerprints(fp_path)
+    assert len(offsets) == len(data) == len(configs)
+
+    with open(fp_path, "rb") as f:
+        for i in reversed(range(len(offsets))):
+            f.seek(offsets[i])
+            sample = pickle.load(f)
+            assert np.allclose(sample["zeta"], data[i]["zeta"])
+            assert np.allclose(sample["dzetadr_forces"], data[i]["dzetadr_forces"])
+
+
 if __name__ == "__main__":
     test_descriptor()
+    test_index_fingerprints(".")
@@ -0,0 +1,99 @@
+import os
+import torch
+from kliff import nn
+from kliff.calculators import CalculatorTorch
+from kliff.dataset import Dataset
+from kliff.descriptors import SymmetryFunction
+from kliff.models import NeuralNetwork
+
+
+def create_model(seed=35, normalize=True):
+    desc = SymmetryFunction(
+        cut_name="cos", cut_dists={"Si-Si": 5.0}, hyperparams="set30", normalize=normalize
+    )
+    model = NeuralNetwork(desc, seed=seed)
+    model.add_layers(
+        nn.Linear(len(desc), 10),
+        nn.Tanh(),
+        nn.Linear(10, 10),
+        nn.Tanh(),
+        nn.Linear(10, 1),
+    )
+    return model
+
+
+def test_state_dict():
+    model = create_model()
+
+    # the parameters of the k-th layer are named `layer_<k>.*`, as in saved models
+    keys = ["layer_{}.{}".format(k, n) for k in (1, 3, 5) for n in ("weight", "bias")]
+    assert list(model.state_dict().keys()) == keys
+
+    model2 = create_model(seed=1)
+    model2.load_state_dict(model.state_dict())
+    for p, p2 in zip(model.parameters(), model2.parameters()):
+        assert torch.equal(p, p2)
+
+
+def test_quantize_for_inference():
+    try:
+        from torch.ao.nn.quantized.dynamic import Linear as QuantizedLinear
+    except ImportError:
+        from torch.nn.quantized.dynamic import Linear as QuantizedLinear
+
+    model = create_model()
+    params = [p.detach().clone() for p in model.parameters()]
+    qmodel = model.quantize_for_inference()
+
+    assert isinstance(qmodel, NeuralNetwork)
+    assert qmodel.descriptor is model.descriptor
+    assert qmodel.dtype == torch.float32
+    assert not qmodel.training
+    linear = [m for m in qmodel.modules() if isinstance(m, QuantizedLinear)]
+    assert len(linear) == 3
+    assert [qmodel.layers[i] for i in (0, 2, 4)] == linear
+    assert not any(isinstance(m, nn.Linear) for m in qmodel.modules())
+
+    # close to the floating point model
+    torch.manual_seed(35)
+    x = torch.rand(20, len(model.descriptor), dtype=torch.float32)
+    model.eval()
+    with torch.no_grad():
+        y = model(x)
+        yq = qmodel(x)
+    assert yq.shape == y.shape
+    assert torch.allclose(yq, y, atol=0.02)
+
+    # the model itself is not modified
+    assert model.layers[0].__class__ is nn.Linear
+    for p, p0 in zip(model.parameters(), params):
+        assert torch.equal(p, p0)
+
+
+def test_quantize_for_inference_calculator(tmp_path):
+    # not normalized, so that no mean and stdev file is written
+    model = create_model(normalize=False)
+    qmodel = model.quantize_for_inference()
+    model.eval()
+    dset = Dataset()
+    dset.read("./configs_extxyz/Si_4")
+    fp_path = os.path.join(str(tmp_path), "fingerprints.pkl")
+    energies = []
+    for m in [model, qmodel]:
+        calc = CalculatorTorch(m)
+        calc.create(
+            dset.get_configs(),
+            use_energy=True,
+            use_forces=False,
+            fingerprints_path=fp_path,
+        )
+        batch = next(iter(calc.get_compute_arguments(batch_size=4)))
+        energies.append(torch.stack(calc.compute(batch)["energy"]).detach())
+    assert energies[1].shape == (4,)
+    assert torch.allclose(energies[1], energies[0], rtol=0.05)
+
+
+if __name__ == "__main__":
+    test_state_dict()
+    test_quantize_for_inference()
+    test_quantize_for_inference_calculator(".")
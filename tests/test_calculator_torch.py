@@ -0,0 +1,194 @@
+import numpy as np
+import pytest
+import torch
+from kliff import nn
+from kliff.calculators import CalculatorTorch
+from kliff.calculators.calculator_torch import CalculatorTorchSeparateSpecies
+from kliff.dataset import Dataset
+from kliff.descriptors import SymmetryFunction
+from kliff.models import NeuralNetwork
+
+
+def get_configs():
+    dset = Dataset()
+    dset.read("configs_extxyz/Si_4")
+    return dset.get_configs()
+
+
+def create_model(dtype=None, desc_dtype=np.float32):
+    desc = SymmetryFunction(
+        cut_name="cos",
+        cut_dists={"Si-Si": 5.0},
+        hyperparams="set30",
+        normalize=True,
+        dtype=desc_dtype,
+    )
+    model = NeuralNetwork(desc, dtype=dtype)
+    model.add_layers(nn.Linear(len(desc), 10), nn.Tanh(), nn.Linear(10, 1))
+    return model
+
+
+def test_compile_model(monkeypatch):
+    from torch._dynamo.testing import CompileCounter
+
+    # count the graphs compiled by the calculator, without generating code
+    counter = CompileCounter()
+    compile_fn = torch.compile
+    monkeypatch.setattr(
+        torch, "compile", lambda m, **kwargs: compile_fn(m, backend=counter, **kwargs)
+    )
+
+    calc = CalculatorTorch(create_model(), compile_model=True)
+    calc.create(get_configs(), use_energy=True, use_forces=False)
+    for batch in calc.get_compute_arguments(batch_size=2):
+        calc.compute(batch)
+
+    assert counter.frame_count >= 1
+    assert counter.op_count >= 1
+
+
+def test_compile_model_forces():
+    configs = get_configs()
+    model = create_model()
+    model.train()
+    calc = CalculatorTorch(model, compile_model=True)
+    calc.create(configs, use_energy=True, use_forces=True)
+    ref_calc = CalculatorTorch(create_model())
+    ref_calc.create(configs, use_energy=True, use_forces=True)
+
+    # fitting to forces in training mode needs a double backward
+    batches = zip(calc.get_compute_arguments(2), ref_calc.get_compute_arguments(2))
+    for batch, ref_batch in batches:
+        model.zero_grad()
+        results = calc.compute(batch)
+        loss = sum((f ** 2).sum() for f in results["forces"])
+        loss.backward()
+        weight = model.layers[0].weight
+        assert weight.grad is not None and torch.isfinite(weight.grad).all()
+
+        ref_results = ref_calc.compute(ref_batch)
+        for f, ref_f in zip(results["forces"], ref_results["forces"]):
+            assert torch.allclose(f, ref_f)
+
+
+def test_compute_arguments_workers():
+    calc = CalculatorTorch(create_model())
+    calc.create(get_configs(), use_energy=True, use_forces=True)
+
+    # fingerprints loaded in worker processes give the same predictions
+    loader = calc.get_compute_arguments(batch_size=2, num_workers=2)
+    assert loader.num_workers == 2
+    assert loader.persistent_workers
+    for _ in range(2):
+        batches = zip(loader, calc.get_compute_arguments(batch_size=2))
+        for batch, ref_batch in batches:
+            results = calc.compute(batch)
+            ref_results = calc.compute(ref_batch)
+            for key in ["energy", "forces"]:
+                for x, ref_x in zip(results[key], ref_results[key]):
+                    assert torch.equal(x, ref_x)
+
+
+def test_move_to_device(monkeypatch):
+    calc = CalculatorTorch(create_model())
+    calc.create(get_configs(), use_energy=True, use_forces=True)
+    assert not calc.get_compute_arguments(batch_size=2).pin_memory
+
+    # memory is pinned when the model is on a GPU
+    monkeypatch.setattr(calc, "_get_device", lambda: torch.device("cuda"))
+    assert calc.get_compute_arguments(batch_size=2).pin_memory
+
+    # and all the tensors of a sample are moved to the device of the model
+    monkeypatch.setattr(calc, "_get_device", lambda: torch.device("meta"))
+    batch = next(iter(calc.get_compute_arguments(batch_size=2)))
+    calc._move_to_device(batch)
+    for sample in batch:
+        for value in sample.values():
+            if isinstance(value, torch.Tensor):
+                assert value.device.type == "meta"
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires a GPU")
+def test_compute_cuda():
+    model = create_model()
+    calc = CalculatorTorch(model)
+    calc.create(get_configs(), use_energy=True, use_forces=True)
+    ref_results = [calc.compute(b) for b in calc.get_compute_arguments(batch_size=2)]
+
+    model.cuda()
+    for batch, ref in zip(calc.get_compute_arguments(batch_size=2), ref_results):
+        results = calc.compute(batch)
+        for key in ["energy", "forces"]:
+            for x, ref_x in zip(results[key], ref[key]):
+                assert x.is_cuda
+                assert torch.allclose(x.cpu(), ref_x)
+
+
+@pytest.mark.parametrize("trailing", [(), (12,), (4, 3)])
+def test_contract(trailing):
+    torch.manual_seed(35)
+    dedz = torch.rand(5, 7, dtype=torch.float64)
+    dzetadr = torch.rand((5, 7) + trailing, dtype=torch.float64)
+
+    x = CalculatorTorch._contract(dedz, dzetadr)
+    ref = torch.tensordot(dedz, dzetadr, dims=([0, 1], [0, 1]))
+    assert x.shape == ref.shape == trailing
+    assert torch.allclose(x, ref)
+
+    # also for non-contiguous input
+    dzetadr = dzetadr.transpose(0, 1).contiguous().transpose(0, 1)
+    assert torch.allclose(CalculatorTorch._contract(dedz, dzetadr), ref)
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.bfloat16])
+@pytest.mark.parametrize("separate_species", [False, True])
+def test_model_dtype(dtype, separate_species):
+    # the model dtype differs from that of the fingerprints
+    model = create_model(dtype=dtype, desc_dtype=np.float64)
+    if separate_species:
+        calc = CalculatorTorchSeparateSpecies({"Si": model})
+    else:
+        calc = CalculatorTorch(model)
+    calc.create(get_configs(), use_energy=True, use_forces=True)
+
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.01)
+    for batch in calc.get_compute_arguments(batch_size=2):
+        optimizer.zero_grad()
+        results = calc.compute(batch)
+
+        # predictions are in the dtype of the fingerprints
+        for e, f in zip(results["energy"], results["forces"]):
+            assert e.dtype == torch.float64
+            assert f.dtype == torch.float64
+
+        loss = sum(e ** 2 for e in results["energy"])
+        loss = loss + sum((f ** 2).sum() for f in results["forces"])
+        loss.backward()
+
+        # gradients are in the model dtype, and forces contribute to them
+        for p in model.parameters():
+            assert p.dtype == dtype
+            assert p.grad is not None and p.grad.dtype == dtype
+            assert torch.isfinite(p.grad).all()
+        optimizer.step()
+
+
+def test_minimize_eval_model(tmp_path):
+    from kliff.loss import Loss
+
+    # e.g. a model loaded with `mode="eval"`, then fitted to forces only
+    model = create_model()
+    model.eval()
+    model.set_save_metadata(str(tmp_path), start=10, frequency=10)
+    calc = CalculatorTorch(model)
+    calc.create(get_configs(), use_energy=False, use_forces=True)
+    weight = model.layers[0].weight
+    weight0 = weight.detach().clone()
+
+    loss = Loss(calc)
+    loss.minimize(method="Adam", num_epochs=1, batch_size=2, lr=0.01)
+
+    # forces contribute to the gradient, and the parameters are updated
+    assert model.training
+    assert weight.grad is not None and torch.isfinite(weight.grad).all()
+    assert not torch.equal(weight.detach(), weight0)
@@ -1,3 +1,4 @@
+import itertools
 import numpy as np
 from kliff.neighbor import NeighborList
 from kliff.dataset import Configuration
@@ -51,6 +52,8 @@ def test_neigh():
 
     assert np.allclose(coords, target_coords)
     assert np.array_equal(species, target_species)
+    n = conf.get_number_of_atoms()
+    assert neigh.get_padding_species() == target_species[n:]
 
     # contributing
     for i in range(conf.get_number_of_atoms()):
@@ -65,9 +68,64 @@ def test_neigh():
         assert nei_species.size == 0
 
     numneigh, neighlist = neigh.get_numneigh_and_neighlist_1D(request_padding=False)
-    np.array_equal(numneigh, all_numneigh)
-    np.array_equal(neighlist, np.concatenate(all_indices))
+    assert np.array_equal(numneigh, all_numneigh)
+    assert np.array_equal(neighlist, np.concatenate(all_indices))
+
+
+def brute_force_neigh(conf, rcut):
+    r"""Neighbors of each contributing atom, from all the periodic images within
+    `rcut`, as a set of (index of contributing atom, rounded displacement vector)."""
+    cell = np.asarray(conf.cell)
+    coords = np.asarray(conf.coords)
+
+    # number of images needed along each lattice vector, from the spacing of the
+    # lattice planes
+    spacing = 1.0 / np.linalg.norm(np.linalg.inv(cell), axis=0)
+    nmax = np.ceil(rcut / spacing).astype(int) + 1
+    shifts = np.array(
+        list(itertools.product(*[range(-n, n + 1) for n in nmax])), dtype=float
+    )
+    images = coords[None, :, :] + np.dot(shifts, cell)[:, None, :]
+
+    neighbors = []
+    for i, xyz in enumerate(coords):
+        disp = (images - xyz).reshape(-1, 3)
+        r = np.linalg.norm(disp, axis=1)
+        idx = np.flatnonzero((r < rcut) & (r > 1e-10))
+        neighbors.append(set((j % len(coords), tuple(np.round(disp[j], 6))) for j in idx))
+    return neighbors
+
+
+def test_padding_triclinic():
+    # strongly skewed cells, for which every element of the inverse cell matrix
+    # matters in the fractional coordinates transform
+    rcut = 3.0
+    rs = np.random.RandomState(35)
+    for _ in range(200):
+        cell = 4.0 * np.eye(3) + rs.uniform(-2.0, 2.0, (3, 3))
+        if abs(np.linalg.det(cell)) < 20.0:
+            continue
+
+        conf = Configuration()
+        conf.cell = cell
+        conf.PBC = [True, True, True]
+        conf.coords = np.dot(rs.rand(4, 3), cell)
+        conf.species = ["C"] * 4
+        conf.natoms = 4
+
+        neigh = NeighborList(conf, infl_dist=rcut)
+        coords = neigh.get_coords()
+        image = neigh.get_image()
+
+        for i, ref in enumerate(brute_force_neigh(conf, rcut)):
+            idx, _, _ = neigh.get_neigh(i)
+            neighbors = set(
+                (image[j], tuple(np.round(coords[j] - coords[i], 6))) for j in idx
+            )
+            assert len(idx) == len(ref)
+            assert neighbors == ref
 
 
 if __name__ == "__main__":
     test_neigh()
+    test_padding_triclinic()
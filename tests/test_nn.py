@@ -0,0 +1,66 @@
+import warnings
+
+import pytest
+import torch
+from kliff.nn import Dropout
+
+
+def get_input(shape=(20, 8)):
+    torch.manual_seed(35)
+    return torch.rand(shape, dtype=torch.float64) + 1.0
+
+
+@pytest.mark.parametrize("shape", [(20, 8), (1, 20, 8)])
+def test_mask_over_atoms(shape):
+    x = get_input(shape)
+    p = 0.5
+    y = Dropout(p)(x)
+
+    # the same elements are zeroed for all atoms, and the others are scaled
+    ratio = y / x
+    assert y.shape == x.shape
+    assert torch.allclose(ratio, ratio[..., :1, :].expand_as(ratio))
+    assert set(torch.unique(ratio).tolist()) <= {0.0, 1 / (1 - p)}
+
+
+def test_expectation():
+    x = get_input()
+    dropout = Dropout(0.3)
+    n = 20000
+    y = sum(dropout(x) for _ in range(n)) / n
+    assert torch.allclose(y, x, rtol=0.05)
+
+
+def test_eval():
+    x = get_input()
+    dropout = Dropout(0.5)
+    dropout.eval()
+    assert torch.equal(dropout(x), x)
+
+
+def test_p_one():
+    x = get_input()
+    assert torch.equal(Dropout(1.0)(x), torch.zeros_like(x))
+
+
+def test_bad_shape():
+    with pytest.raises(ValueError):
+        Dropout(0.5)(torch.ones(2, 20, 8))
+    with pytest.raises(ValueError):
+        Dropout(0.5)(torch.ones(8))
+
+
+def test_script():
+    x = get_input()
+    dropout = Dropout(0.5)
+    with warnings.catch_warnings():
+        # TorchScript is deprecated in recent versions of PyTorch
+        warnings.simplefilter("ignore")
+        scripted = torch.jit.script(dropout)
+
+    # the same masks are drawn under the same seed
+    torch.manual_seed(35)
+    y_eager = dropout(x)
+    torch.manual_seed(35)
+    y_scripted = scripted(x)
+    assert torch.equal(y_scripted, y_eager)